@@ -0,0 +1,41 @@
+from umberto.inspector import inspect_file
+
+
+def _diamonds(tmp_path, source):
+    path = tmp_path / "classes.py"
+    path.write_text(source)
+    issues = inspect_file(str(path), 3, True, False)
+    return {
+        issue.class_name: issue.message
+        for issue in issues
+        if issue.issue_type == "DiamondInheritance"
+    }
+
+
+def test_diamond_is_reported_through_its_apex(tmp_path):
+    source = (
+        "class A: pass\n"
+        "class B(A): pass\n"
+        "class C(A): pass\n"
+        "class D(B, C): pass\n"
+    )
+    assert _diamonds(tmp_path, source) == {
+        "D": "D has diamond inheritance through: A"
+    }
+
+
+def test_child_of_cycle_has_no_diamond(tmp_path):
+    source = (
+        "class A(B): pass\n"
+        "class B(A): pass\n"
+        "class X(A): pass\n"
+    )
+    assert _diamonds(tmp_path, source) == {}
+
+
+def test_child_of_self_loop_has_no_diamond(tmp_path):
+    source = (
+        "class A(A): pass\n"
+        "class X(A): pass\n"
+    )
+    assert _diamonds(tmp_path, source) == {}
@@ -2,11 +2,30 @@ import argparse
 import os
 import sys
 
-from umberto.inspector import inspect_codebase
-from umberto.reporter import generate_report, save_report, generate_html_report
+from umberto.inspector import iter_issues
+from umberto.reporter import (
+    aggregate_issues,
+    generate_report,
+    save_report,
+    generate_html_report,
+)
 from umberto.refactoring import refactor_inheritance_issues, OPENAI_AVAILABLE
 
 
+def _refactor(issues, api_key, output_dir):
+    """Generate refactoring suggestions, reporting failures without exiting."""
+    try:
+        suggestions = refactor_inheritance_issues(
+            issues, api_key=api_key, output_dir=output_dir
+        )
+        if suggestions:
+            print(f"✨ Generated {len(suggestions)} refactoring suggestions")
+        else:
+            print("No refactoring suggestions generated")
+    except Exception as e:
+        print(f"Error generating refactoring suggestions: {e}", file=sys.stderr)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Detect problematic inheritance patterns in a Python codebase."
@@ -33,6 +52,14 @@ def main():
     parser.add_argument(
         "--save", type=str, help="Path to save the report as a JSON file"
     )
+    parser.add_argument(
+        "--save-format", choices=["json", "jsonl"], default="json",
+        help="Format of the --save report; jsonl writes one issue per line in batches of 5000 (default: json)"
+    )
+    parser.add_argument(
+        "--pretty", action="store_true",
+        help="Indent the --save JSON report for human reading; json format only (default: compact)"
+    )
     parser.add_argument(
         "--html", type=str, help="Path to save the report as an HTML file"
     )
@@ -58,23 +85,76 @@ def main():
         print(f"Error: Path '{args.path}' does not exist.", file=sys.stderr)
         sys.exit(1)
 
+    if args.pretty and args.save_format == "jsonl":
+        print("Error: --pretty only applies to --save-format json", file=sys.stderr)
+        sys.exit(1)
+
+    api_key = None
+    if args.refactor:
+        if not OPENAI_AVAILABLE:
+            print("Error: OpenAI package not available. Install with: pip install openai", file=sys.stderr)
+            sys.exit(1)
+        
+        api_key = args.api_key or os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            print("Error: OpenAI API key required. Set OPENAI_API_KEY environment variable or use --api-key", file=sys.stderr)
+            sys.exit(1)
+
     # Inspect the codebase
-    issues = inspect_codebase(
+    issue_stream = iter_issues(
         path=args.path,
         max_depth=args.max_depth,
         allow_multiple=args.allow_multiple,
         allow_diamond=args.allow_diamond,
     )
 
+    if args.refactor and not args.save and not args.html:
+        # Only the console report is needed: refactor issues as they are
+        # found, collecting them for the report on the way through
+        issues = []
+        inspection_error = None
+
+        def record(stream):
+            # Hold inspection errors back from the refactoring error handler
+            nonlocal inspection_error
+            try:
+                for issue in stream:
+                    issues.append(issue)
+                    yield issue
+            except Exception as e:
+                inspection_error = e
+
+        print("🤖 Generating AI-powered refactoring suggestions...")
+        _refactor(record(issue_stream), api_key, args.refactor_output)
+        if inspection_error is not None:
+            raise inspection_error
+        # Drain anything left unconsumed if refactoring stopped early
+        issues.extend(issue_stream)
+        print()
+        generate_report(issues)
+        if issues:
+            sys.exit(1)
+        return
+
+    issues = list(issue_stream)
+    # Shared by all requested report formats
+    aggregates = aggregate_issues(issues)
+
     # Generate console report (unless quiet mode for saves)
     if not args.quiet or (not args.save and not args.html):
-        generate_report(issues)
+        generate_report(issues, aggregates)
 
     # Save JSON report if requested
     if args.save:
         try:
-            save_report(issues, args.save)
-            print(f"\n💾 JSON report saved to {args.save}")
+            saved = save_report(
+                issues,
+                args.save,
+                aggregates,
+                format=args.save_format,
+                pretty=args.pretty,
+            )
+            print(f"\n💾 JSON report saved to {', '.join(saved)}")
         except Exception as e:
             print(f"Error saving JSON report: {e}", file=sys.stderr)
             sys.exit(1)
@@ -82,7 +162,7 @@ def main():
     # Save HTML report if requested
     if args.html:
         try:
-            generate_html_report(issues, args.html)
+            generate_html_report(issues, args.html, aggregates)
             print(f"\n🌐 HTML report saved to {args.html}")
         except Exception as e:
             print(f"Error saving HTML report: {e}", file=sys.stderr)
@@ -90,26 +170,8 @@ def main():
 
     # Generate refactoring suggestions if requested
     if args.refactor:
-        if not OPENAI_AVAILABLE:
-            print("Error: OpenAI package not available. Install with: pip install openai", file=sys.stderr)
-            sys.exit(1)
-        
-        api_key = args.api_key or os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            print("Error: OpenAI API key required. Set OPENAI_API_KEY environment variable or use --api-key", file=sys.stderr)
-            sys.exit(1)
-        
         print("\n🤖 Generating AI-powered refactoring suggestions...")
-        try:
-            suggestions = refactor_inheritance_issues(
-                issues, api_key=api_key, output_dir=args.refactor_output
-            )
-            if suggestions:
-                print(f"✨ Generated {len(suggestions)} refactoring suggestions")
-            else:
-                print("No refactoring suggestions generated")
-        except Exception as e:
-            print(f"Error generating refactoring suggestions: {e}", file=sys.stderr)
+        _refactor(issues, api_key, args.refactor_output)
 
     # Exit with error code if issues found
     if issues:
@@ -1,10 +1,38 @@
 import ast
+import itertools
 import os
+import re
+import sys
+from collections import defaultdict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
-
-
-@dataclass(frozen=True)
+from typing import (
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+)
+
+# Minimum number of files before inspection is dispatched to a process pool
+PARALLEL_MIN_FILES = 8
+# Files queued per worker process before waiting for results
+PENDING_FILES_PER_WORKER = 4
+
+# Built-in types that shouldn't be inherited from
+PROBLEMATIC_BUILTINS = frozenset({"dict", "list", "tuple", "str", "int", "float"})
+
+
+@dataclass(frozen=True, slots=True)
 class InheritanceIssue:
     filename: str
     class_name: str
@@ -12,6 +40,26 @@ class InheritanceIssue:
     issue_type: str
     message: str
 
+    def __post_init__(self):
+        # These strings repeat across many issues, share a single copy
+        object.__setattr__(self, "filename", sys.intern(self.filename))
+        object.__setattr__(self, "class_name", sys.intern(self.class_name))
+        object.__setattr__(self, "issue_type", sys.intern(self.issue_type))
+
+    def __reduce__(self):
+        # Rebuild through __init__ so issues coming back from worker
+        # processes are interned as well
+        return (
+            InheritanceIssue,
+            (
+                self.filename,
+                self.class_name,
+                self.line_number,
+                self.issue_type,
+                self.message,
+            ),
+        )
+
 
 class InheritanceInspector(ast.NodeVisitor):
     def __init__(
@@ -26,17 +74,20 @@ class InheritanceInspector(ast.NodeVisitor):
         self.allow_multiple = allow_multiple
         self.allow_diamond = allow_diamond
         self.issues: List[InheritanceIssue] = []
-        self.class_bases: Dict[str, List[str]] = {}  # class -> direct base classes
+        # class -> direct base classes
+        self.class_bases: DefaultDict[str, List[str]] = defaultdict(list)
         self.class_nodes: Dict[str, ast.ClassDef] = {}  # class -> AST node
         self.all_classes: Set[str] = set()  # all classes found in this file
+        self._depth_cache: Dict[str, int] = {}  # class -> memoized inheritance depth
+        self._ancestors_cache: Dict[str, FrozenSet[str]] = {}  # class -> all ancestors
 
     def visit_ClassDef(self, node: ast.ClassDef):
         class_name = node.name
-        bases = [
-            self._get_base_name(base)
-            for base in node.bases
-            if self._get_base_name(base) != "<unknown>"
-        ]
+        bases = []
+        for base in node.bases:
+            name = self._get_base_name(base)
+            if name != "<unknown>":
+                bases.append(name)
 
         self.class_bases[class_name] = bases
         self.class_nodes[class_name] = node
@@ -54,21 +105,81 @@ class InheritanceInspector(ast.NodeVisitor):
                 )
             )
 
+        # Single pass over the bases for ABC usage and built-in inheritance
+        inherits_from_abc = False
+        builtin_bases = []
+        for base_name in bases:
+            # Simplified check, would need import tracking for full accuracy
+            if "ABC" in base_name or "abc" in base_name.lower():
+                inherits_from_abc = True
+            if base_name in PROBLEMATIC_BUILTINS:
+                builtin_bases.append(base_name)
+
+        # Single pass over the body for @abstractmethod decorators
+        has_abstract_methods = False
+        for item in node.body:
+            if isinstance(item, ast.FunctionDef):
+                for decorator in item.decorator_list:
+                    if (
+                        isinstance(decorator, ast.Name)
+                        and decorator.id == "abstractmethod"
+                    ) or (
+                        isinstance(decorator, ast.Attribute)
+                        and decorator.attr == "abstractmethod"
+                    ):
+                        has_abstract_methods = True
+                        break
+                if has_abstract_methods:
+                    break
+
         # Check for abstract base classes without implementation
-        self._check_abstract_methods(node, class_name)
+        if has_abstract_methods and not inherits_from_abc:
+            self.issues.append(
+                InheritanceIssue(
+                    filename=self.filename,
+                    class_name=class_name,
+                    line_number=node.lineno,
+                    issue_type="AbstractMethodWithoutABC",
+                    message=f"{class_name} has abstract methods but doesn't inherit from ABC",
+                )
+            )
 
-        # Check for suspicious inheritance patterns
-        self._check_suspicious_patterns(node, class_name, bases)
+        # Check for inheriting from built-in types that shouldn't be inherited from
+        for base_name in builtin_bases:
+            self.issues.append(
+                InheritanceIssue(
+                    filename=self.filename,
+                    class_name=class_name,
+                    line_number=node.lineno,
+                    issue_type="ProblematicBuiltinInheritance",
+                    message=f"{class_name} inherits from built-in type '{base_name}' which may cause issues",
+                )
+            )
+
+        # Check for empty classes that only inherit
+        only_pass = len(node.body) == 1 and isinstance(node.body[0], ast.Pass)
+        if only_pass and bases:
+            self.issues.append(
+                InheritanceIssue(
+                    filename=self.filename,
+                    class_name=class_name,
+                    line_number=node.lineno,
+                    issue_type="EmptyInheritanceClass",
+                    message=f"{class_name} is an empty class that only inherits from {', '.join(bases)}",
+                )
+            )
 
         self.generic_visit(node)
 
     def check(self):
         """Perform post-processing checks that require all classes to be collected."""
+        order, sccs, scc_of = self._build_graph_index()
+        diamonds = self._sweep_graph(order, sccs, scc_of)
+
         # Check inheritance depth
-        for class_name in self.class_bases:
-            depth = self._compute_inheritance_depth(class_name)
+        for class_name, node in self.class_nodes.items():
+            depth = self._depth_cache[class_name]
             if depth > self.max_depth:
-                node = self.class_nodes[class_name]
                 self.issues.append(
                     InheritanceIssue(
                         filename=self.filename,
@@ -81,13 +192,9 @@ class InheritanceInspector(ast.NodeVisitor):
 
         # Check diamond inheritance
         if not self.allow_diamond:
-            for class_name in self.class_bases:
-                diamond_paths = self._find_diamond_inheritance(class_name)
-                if diamond_paths:
-                    node = self.class_nodes[class_name]
-                    diamond_classes = set()
-                    for path in diamond_paths:
-                        diamond_classes.update(path[1:-1])  # exclude start and end
+            for class_name, node in self.class_nodes.items():
+                diamond_classes = diamonds[class_name]
+                if diamond_classes:
                     self.issues.append(
                         InheritanceIssue(
                             filename=self.filename,
@@ -99,205 +206,182 @@ class InheritanceInspector(ast.NodeVisitor):
                     )
 
         # Check for circular inheritance
-        self._check_circular_inheritance()
+        self._check_circular_inheritance(sccs)
 
-    def _get_base_name(self, base) -> str:
+    @staticmethod
+    def _get_base_name(base) -> str:
         """Extract base class name from AST node."""
-        if isinstance(base, ast.Name):
+        # Fast path: most bases are bare names
+        node_type = type(base)
+        if node_type is ast.Name:
+            return base.id
+
+        # Handle generics like List[str], Optional[Type]
+        while node_type is ast.Subscript:
+            base = base.value
+            node_type = type(base)
+
+        if node_type is ast.Name:
             return base.id
-        elif isinstance(base, ast.Attribute):
+        elif node_type is ast.Attribute:
             # Handle cases like module.ClassName
             parts = []
             node = base
-            while isinstance(node, ast.Attribute):
+            while type(node) is ast.Attribute:
                 parts.append(node.attr)
                 node = node.value
-            if isinstance(node, ast.Name):
+            if type(node) is ast.Name:
                 parts.append(node.id)
             return ".".join(reversed(parts))
-        elif isinstance(base, ast.Subscript):
-            # Handle generics like List[str], Optional[Type]
-            return self._get_base_name(base.value)
         else:
             return "<unknown>"
 
-    def _compute_inheritance_depth(
-        self, class_name: str, visited: Optional[Set[str]] = None, depth: int = 0
-    ) -> int:
-        """Compute the maximum inheritance depth for a class."""
-        if visited is None:
-            visited = set()
-
-        if class_name in visited:
-            # Circular inheritance detected, return current depth
-            return depth
-
-        visited.add(class_name)
-        bases = self.class_bases.get(class_name, [])
-
-        if not bases:
-            return depth + 1
-
-        max_depth = 0
-        for base in bases:
-            if base in self.all_classes:  # Only count classes we can analyze
-                base_depth = self._compute_inheritance_depth(
-                    base, visited.copy(), depth + 1
-                )
-                max_depth = max(max_depth, base_depth)
-            else:
-                # External class, assume depth of 1
-                max_depth = max(max_depth, depth + 2)
-
-        return max_depth
-
-    def _find_diamond_inheritance(self, class_name: str) -> List[List[str]]:
-        """Find all diamond inheritance paths for a class."""
-
-        def find_paths_to_base(
-            current: str, target: str, path: List[str], all_paths: List[List[str]]
-        ):
-            if current == target and len(path) > 1:
-                all_paths.append(path.copy())
-                return
-
-            for base in self.class_bases.get(current, []):
-                if base not in path:  # Avoid infinite loops
-                    path.append(base)
-                    find_paths_to_base(base, target, path, all_paths)
-                    path.pop()
-
-        # Find all common ancestors
-        diamond_paths = []
-        ancestors = self._get_all_ancestors(class_name)
-
-        for ancestor in ancestors:
-            paths = []
-            find_paths_to_base(class_name, ancestor, [class_name], paths)
-            if len(paths) > 1:
-                diamond_paths.extend(paths)
-
-        return diamond_paths
-
-    def _get_all_ancestors(
-        self, class_name: str, visited: Optional[Set[str]] = None
-    ) -> Set[str]:
-        """Get all ancestor classes for a given class."""
-        if visited is None:
-            visited = set()
-
-        if class_name in visited:
-            return set()
-
-        visited.add(class_name)
-        ancestors = set()
-
-        for base in self.class_bases.get(class_name, []):
-            if base in self.all_classes:
-                ancestors.add(base)
-                ancestors.update(self._get_all_ancestors(base, visited))
-
-        return ancestors
-
-    def _check_circular_inheritance(self):
-        """Check for circular inheritance patterns."""
-
-        def has_cycle(class_name: str, visited: Set[str], rec_stack: Set[str]) -> bool:
-            visited.add(class_name)
-            rec_stack.add(class_name)
-
-            for base in self.class_bases.get(class_name, []):
-                if base in self.all_classes:
-                    if base not in visited:
-                        if has_cycle(base, visited, rec_stack):
-                            return True
-                    elif base in rec_stack:
-                        return True
-
-            rec_stack.remove(class_name)
-            return False
-
-        visited = set()
-        for class_name in self.all_classes:
-            if class_name not in visited:
-                if has_cycle(class_name, visited, set()):
-                    node = self.class_nodes[class_name]
-                    self.issues.append(
-                        InheritanceIssue(
-                            filename=self.filename,
-                            class_name=class_name,
-                            line_number=node.lineno,
-                            issue_type="CircularInheritance",
-                            message=f"{class_name} is part of a circular inheritance chain",
-                        )
-                    )
-
-    def _check_abstract_methods(self, node: ast.ClassDef, class_name: str):
-        """Check for abstract methods and proper ABC usage."""
-        has_abc_import = False
-        has_abstract_methods = False
-        inherits_from_abc = False
-
-        # Check if ABC is imported (simplified check)
-        # This would need more sophisticated import tracking for full accuracy
-        for base_name in self.class_bases.get(class_name, []):
-            if "ABC" in base_name or "abc" in base_name.lower():
-                inherits_from_abc = True
-                break
-
-        # Check for @abstractmethod decorators
-        for item in node.body:
-            if isinstance(item, ast.FunctionDef):
-                for decorator in item.decorator_list:
-                    if (
-                        isinstance(decorator, ast.Name)
-                        and decorator.id == "abstractmethod"
-                    ):
-                        has_abstract_methods = True
-                    elif (
-                        isinstance(decorator, ast.Attribute)
-                        and decorator.attr == "abstractmethod"
-                    ):
-                        has_abstract_methods = True
-
-        if has_abstract_methods and not inherits_from_abc:
-            self.issues.append(
-                InheritanceIssue(
-                    filename=self.filename,
-                    class_name=class_name,
-                    line_number=node.lineno,
-                    issue_type="AbstractMethodWithoutABC",
-                    message=f"{class_name} has abstract methods but doesn't inherit from ABC",
-                )
-            )
-
-    def _check_suspicious_patterns(
-        self, node: ast.ClassDef, class_name: str, bases: List[str]
-    ):
-        """Check for suspicious inheritance patterns."""
-        # Check for inheriting from built-in types that shouldn't be inherited from
-        problematic_builtins = {"dict", "list", "tuple", "str", "int", "float"}
-        for base in bases:
-            if base in problematic_builtins:
-                self.issues.append(
-                    InheritanceIssue(
-                        filename=self.filename,
-                        class_name=class_name,
-                        line_number=node.lineno,
-                        issue_type="ProblematicBuiltinInheritance",
-                        message=f"{class_name} inherits from built-in type '{base}' which may cause issues",
-                    )
+    def _build_graph_index(
+        self,
+    ) -> Tuple[List[str], List[List[str]], Dict[str, int]]:
+        """Index the class graph once for all post-processing checks.
+
+        Returns the classes in topological order (bases first), the strongly
+        connected components in the same order and the component index of
+        each class.
+        """
+        sccs = self._tarjan_sccs()
+        scc_of: Dict[str, int] = {}
+        for i, component in enumerate(sccs):
+            for name in component:
+                scc_of[name] = i
+
+        order = [name for component in sccs for name in component]
+        return order, sccs, scc_of
+
+    def _sweep_graph(
+        self, order: List[str], sccs: List[List[str]], scc_of: Dict[str, int]
+    ) -> Dict[str, Set[str]]:
+        """Compute depths, ancestors and diamond apexes in one topological sweep.
+
+        Depths and ancestor sets are stored in _depth_cache and
+        _ancestors_cache; the diamond apexes (ancestors reachable through more
+        than one path) are returned per class. Edges inside a cycle are
+        ignored, the cycle itself is reported separately.
+        """
+        class_bases = self.class_bases
+        all_classes = self.all_classes
+        depths = self._depth_cache
+        ancestors_of = self._ancestors_cache
+        diamonds: Dict[str, Set[str]] = {}
+
+        for name in order:
+            depth = 1
+            ancestors: Set[str] = set()
+            apexes: Set[str] = set()
+            for base in class_bases[name]:
+                if base not in all_classes:
+                    # External class, assume depth of 1
+                    depth = max(depth, 2)
+                    continue
+                if scc_of[base] == scc_of[name]:
+                    continue
+
+                depth = max(depth, depths[base] + 1)
+                apexes |= diamonds[base]
+                # An ancestor already reached through another base is the
+                # apex of a diamond; a base in a cycle is among its own
+                # ancestors, so it is merged in rather than chained
+                for ancestor in ancestors_of[base] | {base}:
+                    if ancestor in ancestors:
+                        apexes.add(ancestor)
+                    else:
+                        ancestors.add(ancestor)
+
+            depths[name] = depth
+            ancestors_of[name] = frozenset(ancestors)
+            diamonds[name] = apexes
+
+            component = sccs[scc_of[name]]
+            if name == component[-1] and (
+                len(component) > 1 or name in class_bases[name]
+            ):
+                # Last member of a cycle: classes in a cycle are ancestors of
+                # each other (and themselves)
+                shared = frozenset(component).union(
+                    *(ancestors_of[member] for member in component)
                 )
-
-        # Check for empty classes that only inherit
-        if len(node.body) == 1 and isinstance(node.body[0], ast.Pass) and bases:
+                for member in component:
+                    ancestors_of[member] = shared
+
+        return diamonds
+
+    def _tarjan_sccs(self) -> List[List[str]]:
+        """Compute strongly connected components of the class graph (Tarjan)."""
+        class_bases = self.class_bases
+        all_classes = self.all_classes
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        sccs: List[List[str]] = []
+        counter = 0
+
+        for root in all_classes:
+            if root in index:
+                continue
+
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            worklist = [(root, iter(class_bases[root]))]
+
+            while worklist:
+                node, bases = worklist[-1]
+                for base in bases:
+                    if base not in all_classes:
+                        continue
+                    if base not in index:
+                        index[base] = lowlink[base] = counter
+                        counter += 1
+                        stack.append(base)
+                        on_stack.add(base)
+                        worklist.append((base, iter(class_bases[base])))
+                        break
+                    elif base in on_stack:
+                        lowlink[node] = min(lowlink[node], index[base])
+                else:
+                    # All bases explored, finish this node
+                    worklist.pop()
+                    if worklist:
+                        parent = worklist[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.remove(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        sccs.append(component)
+
+        return sccs
+
+    def _check_circular_inheritance(self, sccs: List[List[str]]):
+        """Check for circular inheritance patterns, one issue per cycle."""
+        for component in sccs:
+            if len(component) == 1:
+                class_name = component[0]
+                if class_name not in self.class_bases[class_name]:
+                    continue
+
+            class_name = min(component)
+            node = self.class_nodes[class_name]
             self.issues.append(
                 InheritanceIssue(
                     filename=self.filename,
                     class_name=class_name,
                     line_number=node.lineno,
-                    issue_type="EmptyInheritanceClass",
-                    message=f"{class_name} is an empty class that only inherits from {', '.join(bases)}",
+                    issue_type="CircularInheritance",
+                    message=f"Cycle detected: {' -> '.join(sorted(component))}",
                 )
             )
 
@@ -350,15 +434,52 @@ def inspect_file(
         ]
 
 
-def inspect_codebase(
+def _iter_py_files(root: str, exclude_regex: Pattern[str]) -> Iterator[str]:
+    """Lazily yield the .py files under root, skipping excluded directories."""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not exclude_regex.search(entry.name):
+                    subdirs.append(entry.path)
+            elif entry.name.endswith(".py") and entry.is_file():
+                yield entry.path
+
+        # Reversed so directories are visited in listing order
+        stack.extend(reversed(subdirs))
+
+
+def _inspect_file_star(args: Tuple[str, int, bool, bool]) -> List[InheritanceIssue]:
+    """Picklable wrapper to run inspect_file in a worker process."""
+    return inspect_file(*args)
+
+
+def iter_issues(
     path: str,
     max_depth: int = 3,
     allow_multiple: bool = True,
     allow_diamond: bool = True,
     exclude_patterns: Optional[List[str]] = None,
-) -> List[InheritanceIssue]:
-    """Inspect a Python codebase for inheritance issues."""
-    issues: List[InheritanceIssue] = []
+    max_workers: Optional[int] = None,
+) -> Iterator[InheritanceIssue]:
+    """Lazily yield the inheritance issues of a Python codebase, file by file.
+
+    Codebases of PARALLEL_MIN_FILES or more files are inspected in a pool of
+    max_workers processes (one per CPU if None); max_workers=1 inspects them
+    serially in the calling process. With the "spawn" or "forkserver" start
+    methods the pool requires the calling script to be guarded with
+    `if __name__ == "__main__":`.
+
+    Issues of one file are always yielded together, but when files are
+    inspected in parallel they come in completion order.
+    """
     exclude_patterns = exclude_patterns or [
         "__pycache__",
         ".git",
@@ -370,23 +491,63 @@ def inspect_codebase(
     if os.path.isfile(path):
         # Single file
         if path.endswith(".py"):
-            return inspect_file(path, max_depth, allow_multiple, allow_diamond)
-        else:
-            return []
+            yield from inspect_file(path, max_depth, allow_multiple, allow_diamond)
+        return
 
     # Directory traversal
-    for root, dirs, files in os.walk(path):
-        # Filter out excluded directories
-        dirs[:] = [
-            d for d in dirs if not any(pattern in d for pattern in exclude_patterns)
-        ]
+    exclude_regex = re.compile("|".join(re.escape(p) for p in exclude_patterns))
+    args = (
+        (p, max_depth, allow_multiple, allow_diamond)
+        for p in _iter_py_files(path, exclude_regex)
+    )
+
+    if max_workers == 1:
+        for file_issues in map(_inspect_file_star, args):
+            yield from file_issues
+        return
+
+    # Peek ahead: small codebases are not worth the process pool startup cost
+    head = list(itertools.islice(args, PARALLEL_MIN_FILES))
+    if len(head) < PARALLEL_MIN_FILES:
+        for file_issues in map(_inspect_file_star, head):
+            yield from file_issues
+        return
+
+    # Yield each file's issues as soon as it is done, keeping a bounded
+    # number of files in flight so the walk and the consumer stay in step
+    max_pending = PENDING_FILES_PER_WORKER * (max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        for file_args in itertools.chain(head, args):
+            pending.add(executor.submit(_inspect_file_star, file_args))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+        for future in as_completed(pending):
+            yield from future.result()
 
-        for file in files:
-            if file.endswith(".py"):
-                full_path = os.path.join(root, file)
-                file_issues = inspect_file(
-                    full_path, max_depth, allow_multiple, allow_diamond
-                )
-                issues.extend(file_issues)
 
-    return issues
+def inspect_codebase(
+    path: str,
+    max_depth: int = 3,
+    allow_multiple: bool = True,
+    allow_diamond: bool = True,
+    exclude_patterns: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
+) -> List[InheritanceIssue]:
+    """Inspect a Python codebase for inheritance issues.
+
+    See iter_issues for max_workers; pass 1 to stay in the calling process.
+    """
+    return list(
+        iter_issues(
+            path,
+            max_depth,
+            allow_multiple,
+            allow_diamond,
+            exclude_patterns,
+            max_workers,
+        )
+    )
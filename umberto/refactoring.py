@@ -1,10 +1,14 @@
 import ast
 import os
+import time
+from string import Formatter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 try:
-    from openai import OpenAI
+    from openai import OpenAI, RateLimitError
 
     OPENAI_AVAILABLE = True
 except ImportError:
@@ -12,6 +16,48 @@ except ImportError:
 
 from .inspector import InheritanceIssue
 
+# Retry policy for OpenAI requests hitting the rate limit
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 2.0  # seconds, doubled on every retry
+
+
+@lru_cache(maxsize=256)
+def _load_source_and_tree(path: str) -> Tuple[str, ast.Module]:
+    """Read and parse a source file once, caching the result by path."""
+    with open(path, "r", encoding="utf-8") as f:
+        source = f.read()
+    return source, ast.parse(source)
+
+
+@lru_cache(maxsize=256)
+def _class_index(
+    path: str,
+) -> Tuple[str, Dict[Tuple[str, int], ast.ClassDef]]:
+    """Index the class definitions of a file by (name, line number)."""
+    source, tree = _load_source_and_tree(path)
+    index = {
+        (node.name, node.lineno): node
+        for node in ast.walk(tree)
+        if isinstance(node, ast.ClassDef)
+    }
+    return source, index
+
+
+def _compile_prompt(template: str) -> Callable[[Dict[str, object]], str]:
+    """Split a format template once into literal chunks and field names."""
+    parts = [
+        (literal, field_name)
+        for literal, field_name, _, _ in Formatter().parse(template)
+    ]
+
+    def render(values: Dict[str, object]) -> str:
+        return "".join(
+            literal if field_name is None else literal + str(values[field_name])
+            for literal, field_name in parts
+        )
+
+    return render
+
 
 @dataclass
 class RefactoringSuggestion:
@@ -127,43 +173,22 @@ Please suggest how to improve this code using composition instead of inheritance
             ),
         }
 
+        # Pre-split templates so rendering doesn't reparse them per issue
+        self._compiled_prompts: Dict[str, Callable[[Dict[str, object]], str]] = {
+            issue_type: _compile_prompt(template)
+            for issue_type, template in self.prompt_templates.items()
+        }
+
     def get_class_code(
         self, filename: str, class_name: str, line_number: int
     ) -> Optional[str]:
         """Extract the class code from the file."""
         try:
-            with open(filename, "r", encoding="utf-8") as f:
-                source = f.read()
-
-            tree = ast.parse(source)
-
-            for node in ast.walk(tree):
-                if (
-                    isinstance(node, ast.ClassDef)
-                    and node.name == class_name
-                    and node.lineno == line_number
-                ):
-
-                    # Extract the class code
-                    lines = source.split("\n")
-                    start_line = node.lineno - 1
-
-                    # Find the end of the class
-                    end_line = start_line + 1
-                    base_indent = len(lines[start_line]) - len(
-                        lines[start_line].lstrip()
-                    )
-
-                    for i in range(start_line + 1, len(lines)):
-                        line = lines[i]
-                        if line.strip() == "":
-                            continue
-                        current_indent = len(line) - len(line.lstrip())
-                        if current_indent <= base_indent and line.strip():
-                            break
-                        end_line = i + 1
-
-                    return "\n".join(lines[start_line:end_line])
+            source, class_index = _class_index(os.path.abspath(filename))
+            node = class_index.get((class_name, line_number))
+            if node is not None:
+                # Padding keeps the first line aligned for nested classes
+                return ast.get_source_segment(source, node, padded=True)
 
         except Exception as e:
             print(f"Error extracting class code: {e}")
@@ -186,21 +211,23 @@ Please suggest how to improve this code using composition instead of inheritance
             return None
 
         # Select appropriate prompt template
-        template = self.prompt_templates.get(
-            issue.issue_type, self.prompt_templates["default"]
+        render = self._compiled_prompts.get(
+            issue.issue_type, self._compiled_prompts["default"]
         )
 
-        prompt = template.format(
-            filename=issue.filename,
-            class_name=issue.class_name,
-            line_number=issue.line_number,
-            issue_type=issue.issue_type,
-            message=issue.message,
-            code=class_code,
+        prompt = render(
+            {
+                "filename": issue.filename,
+                "class_name": issue.class_name,
+                "line_number": issue.line_number,
+                "issue_type": issue.issue_type,
+                "message": issue.message,
+                "code": class_code,
+            }
         )
 
         try:
-            response = self.client.chat.completions.create(
+            response = self._create_completion(
                 model=self.model,
                 messages=[
                     {
@@ -243,22 +270,39 @@ Please suggest how to improve this code using composition instead of inheritance
             print(f"Error getting AI suggestion: {e}")
             return None
 
+    def _create_completion(self, **kwargs):
+        """Create a chat completion, backing off when rate limited."""
+        delay = RATE_LIMIT_BACKOFF
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            try:
+                return self.client.chat.completions.create(**kwargs)
+            except RateLimitError:
+                if attempt == RATE_LIMIT_RETRIES:
+                    raise
+                time.sleep(delay)
+                delay *= 2
+
     def batch_refactor_suggestions(
-        self, issues: List[InheritanceIssue], issue_types: Optional[List[str]] = None
+        self,
+        issues: Iterable[InheritanceIssue],
+        issue_types: Optional[List[str]] = None,
+        max_workers: int = 8,
     ) -> List[RefactoringSuggestion]:
         """Get refactoring suggestions for multiple issues."""
-        suggestions = []
-
         # Filter by issue types if specified
         if issue_types:
-            issues = [issue for issue in issues if issue.issue_type in issue_types]
+            issues = (issue for issue in issues if issue.issue_type in issue_types)
 
-        for issue in issues:
-            suggestion = self.get_refactoring_suggestion(issue)
-            if suggestion:
-                suggestions.append(suggestion)
+        # Requests are I/O bound, so run them concurrently as issues arrive;
+        # results are collected in submission order to keep the output stable
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.get_refactoring_suggestion, issue)
+                for issue in issues
+            ]
+            results = [future.result() for future in futures]
 
-        return suggestions
+        return [suggestion for suggestion in results if suggestion]
 
     def save_suggestions(
         self,
@@ -315,7 +359,7 @@ def get_composition_suggestion(
 
 # Example usage and integration
 def refactor_inheritance_issues(
-    issues: List[InheritanceIssue],
+    issues: Iterable[InheritanceIssue],
     api_key: Optional[str] = None,
     output_dir: str = "refactoring_suggestions",
 ) -> List[RefactoringSuggestion]:
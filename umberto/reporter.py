@@ -1,116 +1,361 @@
 import json
-from typing import Dict, List
-from collections import defaultdict, Counter
+import os
+import sys
+from itertools import groupby
+from operator import attrgetter
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+from collections import defaultdict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from markupsafe import escape
+except ImportError:
+    from html import escape
 
 from .inspector import InheritanceIssue
 
+# Issue fields in report order, fetched in a single call per issue
+_FIELDS = ("filename", "class_name", "line_number", "issue_type", "message")
+_get_fields = attrgetter(*_FIELDS)
+_get_filename = attrgetter("filename")
+_get_class_name = attrgetter("class_name")
+_get_issue_type = attrgetter("issue_type")
+
+# Buffer size for report files, large enough to batch many small writes
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Reports with at least this many issues are grouped with sort + groupby
+_GROUPBY_MIN_ISSUES = 1000
+
+# Issue type symbols and descriptions for the console report
+_TYPE_INFO = {
+    "MultipleInheritance": ("🔀", "Multiple Inheritance"),
+    "InheritanceDepth": ("📏", "Inheritance Depth"),
+    "DiamondInheritance": ("💎", "Diamond Inheritance"),
+    "SyntaxError": ("❌", "Syntax Error"),
+}
+
+# Issue type CSS classes for the HTML report
+_TYPE_CLASSES = {
+    "MultipleInheritance": "multiple",
+    "InheritanceDepth": "depth", 
+    "DiamondInheritance": "diamond",
+    "SyntaxError": "syntax"
+}
+
+_HTML_EMPTY = """
+        <!DOCTYPE html>
+        <html><head><title>Inheritance Report</title></head>
+        <body><h1>✅ No inheritance issues found.</h1></body></html>
+        """.encode("utf-8")
+
+_HTML_HEAD = b"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Inheritance Analysis Report</title>
+            <style>
+                body { font-family: Arial, sans-serif; margin: 20px; }
+                .header { background-color: #f4f4f4; padding: 20px; border-radius: 5px; }
+                .issue-type { margin: 20px 0; }
+                .issue { background-color: #fff; border-left: 4px solid #007acc; padding: 10px; margin: 10px 0; }
+                .issue.multiple { border-left-color: #ff6b6b; }
+                .issue.depth { border-left-color: #ffa500; }
+                .issue.diamond { border-left-color: #9b59b6; }
+                .issue.syntax { border-left-color: #e74c3c; }
+                .filename { font-weight: bold; color: #007acc; }
+                .class-name { font-weight: bold; color: #2ecc71; }
+                .summary { background-color: #e8f5e8; padding: 15px; border-radius: 5px; margin: 20px 0; }
+            </style>
+        </head>
+        <body>"""
+
+_HTML_ISSUE = """
+                <div class="issue {css_class}">
+                    <div class="filename">{filename}:{line_number}</div>
+                    <div>Class: <span class="class-name">{class_name}</span></div>
+                    <div>Issue: {message}</div>
+                </div>
+                """
+
+_HTML_FOOTER = b"</body></html>"
+
+
+def _make_renderer(css_class: str):
+    """Generate an issue renderer with the CSS class and template inlined.
+
+    The returned function takes the _FIELDS tuple of an issue and returns its
+    HTML block; the template is baked into the generated code as a constant.
+    """
+    template = (
+        _HTML_ISSUE.replace("%", "%%")
+        .replace("{css_class}", css_class)
+        .replace("{filename}", "%s")
+        .replace("{line_number}", "%s")
+        .replace("{class_name}", "%s")
+        .replace("{message}", "%s")
+    )
+    source = (
+        "def render(fields):\n"
+        "    filename, class_name, line_number, _, message = fields\n"
+        f"    return {template!r} % (\n"
+        "        escape(filename), line_number, escape(class_name), escape(message)\n"
+        "    )\n"
+    )
+    namespace = {"escape": escape}
+    exec(compile(source, f"<render {css_class or 'generic'}>", "exec"), namespace)
+    return namespace["render"]
+
+
+# Specialized HTML renderers per issue type, generic one for unknown types
+_RENDERERS = {
+    issue_type: _make_renderer(css_class)
+    for issue_type, css_class in _TYPE_CLASSES.items()
+}
+_render_generic = _make_renderer("")
+
+
+@dataclass
+class ReportAggregates:
+    """Report statistics shared by the console, JSON and HTML reports.
+
+    Build it once with aggregate_issues() and pass it to each report.
+    """
+
+    by_type: Dict[str, List[InheritanceIssue]]
+    files: Set[str]
+    classes: Set[str]
+    type_counts: Dict[str, int]
+
+
+def _dumps(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON, using orjson when available.
+
+    Output is compact unless indent is set, which uses two-space indentation.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def aggregate_issues(issues: List[InheritanceIssue]) -> ReportAggregates:
+    """Group issues by type and collect report statistics.
+
+    Large reports are grouped with a C-level sort + groupby, which lists the
+    issue types alphabetically; smaller ones keep first-seen order with a
+    single Python-level pass.
+    """
+    if len(issues) >= _GROUPBY_MIN_ISSUES:
+        by_type = {
+            issue_type: list(group)
+            for issue_type, group in groupby(
+                sorted(issues, key=_get_issue_type), key=_get_issue_type
+            )
+        }
+        return ReportAggregates(
+            by_type,
+            set(map(_get_filename, issues)),
+            set(map(_get_class_name, issues)),
+            {issue_type: len(group) for issue_type, group in by_type.items()},
+        )
+
+    by_type = defaultdict(list)
+    files = set()
+    classes = set()
+    for issue in issues:
+        filename, class_name, _, issue_type, _ = _get_fields(issue)
+        by_type[issue_type].append(issue)
+        files.add(filename)
+        classes.add(class_name)
+    # The groups already hold the counts, in first-seen order
+    type_counts = {issue_type: len(group) for issue_type, group in by_type.items()}
+    return ReportAggregates(by_type, files, classes, type_counts)
+
 
-def generate_report(issues: List[InheritanceIssue]) -> None:
+def generate_report(
+    issues: List[InheritanceIssue], aggregates: Optional[ReportAggregates] = None
+) -> None:
     """Generate a formatted console report of inheritance issues."""
     if not issues:
         print("✅ No inheritance issues found.")
         return
 
     # Group issues by type
-    issues_by_type = defaultdict(list)
-    for issue in issues:
-        issues_by_type[issue.issue_type].append(issue)
+    if aggregates is None:
+        aggregates = aggregate_issues(issues)
 
-    print(f"🔍 Found {len(issues)} inheritance issue(s)")
-    print("=" * 60)
+    # Collect the whole report and write it at once rather than per line
+    out = []
+    append = out.append
+    append(f"🔍 Found {len(issues)} inheritance issue(s)")
+    append("=" * 60)
 
-    # Issue type symbols and descriptions
-    type_info = {
-        "MultipleInheritance": ("🔀", "Multiple Inheritance"),
-        "InheritanceDepth": ("📏", "Inheritance Depth"),
-        "DiamondInheritance": ("💎", "Diamond Inheritance"),
-        "SyntaxError": ("❌", "Syntax Error"),
+    # Resolve symbol and description once per issue type
+    resolved = {
+        issue_type: _TYPE_INFO.get(issue_type, ("⚠️", issue_type))
+        for issue_type in aggregates.by_type
     }
 
-    for issue_type, issue_list in issues_by_type.items():
-        symbol, description = type_info.get(issue_type, ("⚠️", issue_type))
-        print(f"\n{symbol} {description} ({len(issue_list)} issue(s)):")
-        print("-" * 40)
+    for issue_type, issue_list in aggregates.by_type.items():
+        symbol, description = resolved[issue_type]
+        append(f"\n{symbol} {description} ({len(issue_list)} issue(s)):")
+        append("-" * 40)
         
         for issue in issue_list:
-            print(f"  📁 {issue.filename}:{issue.line_number}")
-            print(f"     Class: {issue.class_name}")
-            print(f"     Issue: {issue.message}")
-            print()
+            filename, class_name, line_number, _, message = _get_fields(issue)
+            append(
+                f"  📁 {filename}:{line_number}\n"
+                f"     Class: {class_name}\n"
+                f"     Issue: {message}\n"
+            )
 
     # Summary statistics
-    print("📊 Summary:")
-    print("-" * 20)
-    files_affected = len(set(issue.filename for issue in issues))
-    classes_affected = len(set(issue.class_name for issue in issues))
-    print(f"  Files affected: {files_affected}")
-    print(f"  Classes affected: {classes_affected}")
+    append("📊 Summary:")
+    append("-" * 20)
+    append(f"  Files affected: {len(aggregates.files)}")
+    append(f"  Classes affected: {len(aggregates.classes)}")
     
     # Issue type breakdown
-    print(f"  Issue breakdown:")
-    for issue_type, count in Counter(issue.issue_type for issue in issues).items():
-        symbol, description = type_info.get(issue_type, ("⚠️", issue_type))
-        print(f"    {symbol} {description}: {count}")
+    append(f"  Issue breakdown:")
+    for issue_type, count in aggregates.type_counts.items():
+        symbol, description = resolved[issue_type]
+        append(f"    {symbol} {description}: {count}")
+
+    append("")
+    sys.stdout.write("\n".join(out))
+    sys.stdout.flush()
+
+
+def save_report(
+    issues: Iterable[InheritanceIssue],
+    filepath: str,
+    aggregates: Optional[ReportAggregates] = None,
+    format: str = "json",
+    batch_size: Optional[int] = 5000,
+    *,
+    pretty: bool = False,
+    summary: bool = True,
+) -> List[str]:
+    """Save the report as JSON, streaming the issues one by one.
+
+    With format="json" a single JSON document is written to filepath. With
+    format="jsonl" the summary goes to "<base>.summary.json" and the issues,
+    one per line, to "<base>-000.jsonl", "<base>-001.jsonl", ... holding
+    batch_size issues each (or all of them in filepath if batch_size is
+    None). "<base>-000.jsonl" is created even when there are no issues.
+
+    The JSON document is compact by default, which is what machine
+    consumers should use; pretty=True indents it for human reading (json
+    format only).
 
+    With summary=False no statistics are computed or written, so issues can
+    be any iterable (e.g. iter_issues()) and is consumed in a single pass.
 
-def save_report(issues: List[InheritanceIssue], filepath: str) -> None:
-    """Save the report as a JSON file."""
-    report_data = {
-        "summary": {
+    Returns the paths of the files written.
+    """
+    if format not in ("json", "jsonl"):
+        raise ValueError(f"Unsupported report format: {format}")
+    if pretty and format == "jsonl":
+        raise ValueError("pretty only applies to the json format")
+
+    report_summary = None
+    if summary:
+        # The summary needs every issue before the first one is written
+        if not isinstance(issues, list):
+            issues = list(issues)
+        if aggregates is None:
+            aggregates = aggregate_issues(issues)
+        report_summary = {
             "total_issues": len(issues),
-            "files_affected": len(set(issue.filename for issue in issues)),
-            "classes_affected": len(set(issue.class_name for issue in issues)),
-            "issue_types": dict(Counter(issue.issue_type for issue in issues))
-        },
-        "issues": [
-            {
-                "filename": issue.filename,
-                "class_name": issue.class_name,
-                "line_number": issue.line_number,
-                "issue_type": issue.issue_type,
-                "message": issue.message,
-            }
-            for issue in issues
-        ]
-    }
-    
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(report_data, f, indent=2, ensure_ascii=False)
+            "files_affected": len(aggregates.files),
+            "classes_affected": len(aggregates.classes),
+            "issue_types": dict(aggregates.type_counts)
+        }
 
+    if format == "jsonl":
+        return _save_jsonl(issues, filepath, report_summary, batch_size)
 
-def generate_html_report(issues: List[InheritanceIssue], filepath: str) -> None:
-    """Generate an HTML report of inheritance issues."""
-    if not issues:
-        html_content = """
-        <!DOCTYPE html>
-        <html><head><title>Inheritance Report</title></head>
-        <body><h1>✅ No inheritance issues found.</h1></body></html>
-        """
+    if pretty:
+        # Nested values are indented one level (summary) or two (issues)
+        head, sep, indent = b'{\n  ', b',\n    ', b'\n    '
+        open_issues, tail, empty = b'"issues": [\n    ', b'\n  ]\n}', b'"issues": []\n}'
+        if report_summary is not None:
+            head += (
+                b'"summary": '
+                + _dumps(report_summary, True).replace(b'\n', b'\n  ')
+                + b',\n  '
+            )
     else:
-        issues_by_type = defaultdict(list)
+        head, sep, indent = b'{', b',', None
+        open_issues, tail, empty = b'"issues":[', b']}', b'"issues":[]}'
+        if report_summary is not None:
+            head += b'"summary":' + _dumps(report_summary) + b','
+
+    with open(filepath, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(head)
+        # The array is opened on the first issue, as an iterator may be empty
+        written = False
         for issue in issues:
-            issues_by_type[issue.issue_type].append(issue)
+            f.write(sep if written else open_issues)
+            written = True
+            record = _dumps(dict(zip(_FIELDS, _get_fields(issue))), pretty)
+            f.write(record.replace(b'\n', indent) if pretty else record)
+        f.write(tail if written else empty)
+    return [filepath]
 
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Inheritance Analysis Report</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                .header {{ background-color: #f4f4f4; padding: 20px; border-radius: 5px; }}
-                .issue-type {{ margin: 20px 0; }}
-                .issue {{ background-color: #fff; border-left: 4px solid #007acc; padding: 10px; margin: 10px 0; }}
-                .issue.multiple {{ border-left-color: #ff6b6b; }}
-                .issue.depth {{ border-left-color: #ffa500; }}
-                .issue.diamond {{ border-left-color: #9b59b6; }}
-                .issue.syntax {{ border-left-color: #e74c3c; }}
-                .filename {{ font-weight: bold; color: #007acc; }}
-                .class-name {{ font-weight: bold; color: #2ecc71; }}
-                .summary {{ background-color: #e8f5e8; padding: 15px; border-radius: 5px; margin: 20px 0; }}
-            </style>
-        </head>
-        <body>
+
+def _save_jsonl(
+    issues: Iterable[InheritanceIssue],
+    filepath: str,
+    summary: Optional[Dict],
+    batch_size: Optional[int],
+) -> List[str]:
+    """Write the summary and the issues as JSON Lines, rotating every batch_size.
+
+    Returns the paths of the files written.
+    """
+    base = os.path.splitext(filepath)[0]
+    paths = []
+    if summary is not None:
+        paths.append(f"{base}.summary.json")
+        with open(paths[-1], 'wb') as f:
+            f.write(_dumps(summary))
+
+    if not batch_size:
+        paths.append(filepath)
+        with open(filepath, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            for issue in issues:
+                f.write(_dumps(dict(zip(_FIELDS, _get_fields(issue)))) + b'\n')
+        return paths
+
+    # The first batch is opened up front so an empty report still has one
+    paths.append(f"{base}-000.jsonl")
+    f = open(paths[-1], 'wb', buffering=_WRITE_BUFFER_SIZE)
+    try:
+        for i, issue in enumerate(issues):
+            if i and i % batch_size == 0:
+                f.close()
+                paths.append(f"{base}-{i // batch_size:03d}.jsonl")
+                f = open(paths[-1], 'wb', buffering=_WRITE_BUFFER_SIZE)
+            f.write(_dumps(dict(zip(_FIELDS, _get_fields(issue)))) + b'\n')
+    finally:
+        f.close()
+    return paths
+
+
+def _iter_html(
+    issues: List[InheritanceIssue], aggregates: ReportAggregates
+) -> Iterator[bytes]:
+    """Yield the encoded HTML report chunk by chunk."""
+    yield _HTML_HEAD
+    yield f"""
             <div class="header">
                 <h1>🔍 Inheritance Analysis Report</h1>
                 <p>Found {len(issues)} inheritance issue(s)</p>
@@ -119,38 +364,37 @@ def generate_html_report(issues: List[InheritanceIssue], filepath: str) -> None:
             <div class="summary">
                 <h2>📊 Summary</h2>
                 <ul>
-                    <li>Files affected: {len(set(issue.filename for issue in issues))}</li>
-                    <li>Classes affected: {len(set(issue.class_name for issue in issues))}</li>
+                    <li>Files affected: {len(aggregates.files)}</li>
+                    <li>Classes affected: {len(aggregates.classes)}</li>
                 </ul>
             </div>
-        """
-
-        type_classes = {
-            "MultipleInheritance": "multiple",
-            "InheritanceDepth": "depth", 
-            "DiamondInheritance": "diamond",
-            "SyntaxError": "syntax"
-        }
+        """.encode("utf-8")
 
-        for issue_type, issue_list in issues_by_type.items():
-            html_content += f"""
+    for issue_type, issue_list in aggregates.by_type.items():
+        yield f"""
             <div class="issue-type">
-                <h2>{issue_type.replace('Inheritance', ' Inheritance')} ({len(issue_list)} issue(s))</h2>
-            """
-            
-            for issue in issue_list:
-                css_class = type_classes.get(issue_type, "")
-                html_content += f"""
-                <div class="issue {css_class}">
-                    <div class="filename">{issue.filename}:{issue.line_number}</div>
-                    <div>Class: <span class="class-name">{issue.class_name}</span></div>
-                    <div>Issue: {issue.message}</div>
-                </div>
-                """
-            
-            html_content += "</div>"
+                <h2>{escape(issue_type.replace('Inheritance', ' Inheritance'))} ({len(issue_list)} issue(s))</h2>
+            """.encode("utf-8")
         
-        html_content += "</body></html>"
+        render = _RENDERERS.get(issue_type, _render_generic)
+        yield "".join(map(render, map(_get_fields, issue_list))).encode("utf-8")
+        
+        yield b"</div>"
+    
+    yield _HTML_FOOTER
+
+
+def generate_html_report(
+    issues: List[InheritanceIssue],
+    filepath: str,
+    aggregates: Optional[ReportAggregates] = None,
+) -> None:
+    """Generate an HTML report of inheritance issues."""
+    with open(filepath, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+        if not issues:
+            f.write(_HTML_EMPTY)
+            return
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(html_content)
\ No newline at end of file
+        if aggregates is None:
+            aggregates = aggregate_issues(issues)
+        f.writelines(_iter_html(issues, aggregates))